@@ -1,7 +1,24 @@
 
+_NUM_MASKS = 257
+"""
+number of precomputed bitmasks
+"""
+_MASKS = tuple((1 << k) - 1 for k in range(_NUM_MASKS))
+"""
+precomputed bitmasks: `_MASKS[k]` is all 1s for the first `k`-bits
+"""
+
+def _bitmask(k: int):
+    """
+    Like `bitmask` but without validating `k`.
+    Assumes `k` is a non-negative integer.
+    """
+    if k < _NUM_MASKS:
+        return _MASKS[k]
+    return (1 << k) - 1
 
 def bitmask(k: int):
     """Creates a bitmask that is all 1s for the first `k`-bits."""
     if not isinstance(k, int) or k < 0:
         raise ValueError('must be a non-negative integer', k)
-    return (1 << k) - 1
+    return _bitmask(k)
@@ -0,0 +1,19 @@
+from typing import Iterable, List
+
+from ..utils import _bitmask
+
+def is_integer_batch(c: Iterable[int], exp: Iterable[int]) -> List[bool]:
+    """
+    Batched version of `Num.is_integer`.
+    The numbers are given as parallel sequences of magnitudes `c`
+    and unnormalized exponents `exp` rather than as `Num` instances
+    (the sign has no effect on integrality).
+    Returns a list of booleans, one for each number.
+    """
+    # same cases as `Num.is_integer`: 0 and `exp >= 0` are integers,
+    # a value whose digits are all fractional (`e < 0`) is not,
+    # otherwise the fractional bits must be zero
+    return [
+        ei >= 0 or ci == 0 or (ci.bit_length() + ei > 0 and not (ci & _bitmask(-ei)))
+        for ci, ei in zip(c, exp)
+    ]
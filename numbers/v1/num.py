@@ -1,12 +1,16 @@
+from operator import index
 from typing import Optional
 
-from ..utils import bitmask
+from ..utils import _bitmask
 
 class Num(object):
     """
     Fixed-point numbers, as implemented in Chapter 1.
+    Instances are immutable.
     """
 
+    __slots__ = ('s', 'c', 'exp', '_p', '_e')
+
     s: bool
     """
     sign
@@ -21,26 +25,74 @@ class Num(object):
     """
 
     def __init__(self, s: bool, exp: int, c: int):
+        assert isinstance(s, bool), ('expected a boolean', s)
+        assert isinstance(exp, int), ('expected an integer', exp)
+        assert isinstance(c, int) and c >= 0, ('expected a non-negative integer', c)
+
+        p = c.bit_length()
+        _set_s(self, s)
+        _set_c(self, c)
+        _set_exp(self, exp)
+        _set_p(self, p)
+        _set_e(self, None if c == 0 else exp + p - 1)
+
+    def __repr__(self):
+        return 'Num(s=' + repr(self.s) + ', exp=' + repr(self.exp) + ', c=' + repr(self.c) + ')'
+
+    def __setattr__(self, name, value):
+        raise AttributeError('cannot assign to an immutable Num', name)
+
+    def __delattr__(self, name):
+        raise AttributeError('cannot delete from an immutable Num', name)
+
+    def __eq__(self, other):
+        """
+        Structural equality: `self` and `other` must have the same
+        sign, unnormalized exponent, and magnitude.
+        """
+        if not isinstance(other, Num):
+            return NotImplemented
+        return self.s == other.s and self.exp == other.exp and self.c == other.c
+
+    def __hash__(self):
+        return hash((self.s, self.exp, self.c))
+
+    @classmethod
+    def checked(cls, s: bool, exp: int, c: int):
+        """
+        Constructs a `Num` from untrusted arguments.
+        Unlike the constructor, the arguments are always validated,
+        raising a `ValueError` if they are invalid.
+        """
         if not isinstance(s, bool):
             raise ValueError('expected a boolean', s)
         if not isinstance(exp, int):
             raise ValueError('expected an integer', exp)
         if not isinstance(c, int) or c < 0:
             raise ValueError('expected a non-negative integer', c)
-        
-        self.s = s
-        self.c = c
-        self.exp = exp
+        return cls(s, exp, c)
 
-    def __repr__(self):
-        return 'Num(s=' + repr(self.s) + ', exp=' + repr(self.exp) + ', c=' + repr(self.c) + ')'
+    @classmethod
+    def _new(cls, s: bool, exp: int, c: int, p: int):
+        """
+        Constructs a `Num` from arguments that are known to be valid
+        where `p` is exactly `c.bit_length()`.
+        Bypasses `__init__` entirely.
+        """
+        obj = object.__new__(cls)
+        _set_s(obj, s)
+        _set_c(obj, c)
+        _set_exp(obj, exp)
+        _set_p(obj, p)
+        _set_e(obj, None if c == 0 else exp + p - 1)
+        return obj
 
     @property
     def p(self) -> int:
         """
         Minimum number of binary digits required to encode `self.c`.
         """
-        return self.c.bit_length()
+        return self._p
 
     @property
     def e(self) -> Optional[int]:
@@ -48,10 +100,7 @@ class Num(object):
         Position of the most significant digit.
         Returns `None` if this value is zero.
         """
-        if self.c == 0:
-            return None
-        else:
-            return self.exp + self.p - 1
+        return self._e
 
     @property
     def n(self) -> int:
@@ -68,9 +117,9 @@ class Num(object):
         This is exactly `(-1)^self.s * self.c`.
         """
         if self.s:
-            return -self.m
+            return -self.c
         else:
-            return self.m
+            return self.c
         
     def is_zero(self) -> bool:
         """
@@ -84,49 +133,35 @@ class Num(object):
         Returns whether this value represents an integer.
         """
         # special case: 0 is an integer
-        if self.is_zero():
+        if self.c == 0:
             return True
         
-        assert self.e is not None
-        
         # all significant digits are integer digits
         if self.exp >= 0:
             return True
         
         # all significant digits are fractional digits
-        if self.e < 0:
+        if self._e < 0:
             return False
 
         # must check if fractional bits are zero
-        mask = bitmask(-self.exp)
-        fbits = self.c & mask
-        return fbits == 0
+        return not (self.c & _bitmask(-self.exp))
 
     def bit(self, n: int) -> bool:
         """
         Exercise 1.2:
         Returns the value of the digit at the `n`th position as a boolean.
         """
-        if not isinstance(n, int):
-            raise ValueError('expected an integer', n)
-
-        # special case: 0 has no digits set
-        if self.is_zero():
-            return False
-    
-        assert self.e is not None
+        n = index(n)
 
         # below the region of significance
-        if n < self.exp:
-            return False
-        
-        # above the region of significane
-        if n > self.e:
+        shift = n - self.exp
+        if shift < 0:
             return False
-        
-        idx = n - self.exp
-        bit = self.c & (1 << idx)
-        return bit != 0
+
+        # digits above the region of significance (or of zero)
+        # are shifted out entirely
+        return ((self.c >> shift) & 1) != 0
     
 
     def normalize(self, p: int):
@@ -135,21 +170,21 @@ class Num(object):
         Returns a copy of `self` that has exactly `p` bits of precision.
         If `p < self.p`, a `ValueError` is thrown.
         """
-        if not isinstance(p, int) or p < 0:
-            raise ValueError('expected a non-negative integer', p)
+        p = index(p)
+        assert p >= 0, ('expected a non-negative integer', p)
         
         # special case: 0 has no precision ever
-        if self.is_zero():
+        if self.c == 0:
             return self
         
         # check that the requested precision is enough
-        if p < self.p:
+        if p < self._p:
             raise ValueError('insufficient precision', self, p)
         
-        shift = p - self.p
+        shift = p - self._p
         exp = self.exp - shift
         c = self.c << shift
-        return Num(self.s, exp, c)
+        return Num._new(self.s, exp, c, p)
         
     def split(self, n: int):
         """
@@ -157,40 +192,44 @@ class Num(object):
         Splits `self` into two `Num` values where the first value represents
         the digits above `n` and the second value represents the digits below `n`.
         """
-        if not isinstance(n, int):
-            raise ValueError('expected an integer', n)
+        n = index(n)
         
         # special case: 0 has no precision
-        if self.is_zero():
-            hi = Num(self.s, n + 1, 0)
-            lo = Num(self.s, n, 0)
+        if self.c == 0:
+            hi = Num._new(self.s, n + 1, 0, 0)
+            lo = Num._new(self.s, n, 0, 0)
             return (hi, lo)
         
-        assert self.e is not None
-
         # check if all digits are in the lower part
-        if n >= self.e:
-            hi = Num(self.s, n + 1, 0)
-            lo = Num(self.s, self.exp, self.c)
+        if n >= self._e:
+            hi = Num._new(self.s, n + 1, 0, 0)
+            lo = self
             return (hi, lo)
         
         # check if all digits are in the upper part
         if n < self.exp:
-            hi = Num(self.s, self.exp, self.c)
-            lo = Num(self.s, n, 0)
+            hi = self
+            lo = Num._new(self.s, n, 0, 0)
             return (hi, lo)
         
         # splitting the digits
         p_lo = (n + 1) - self.exp
-        mask_lo = bitmask(p_lo)
-        
+
         exp_hi = self.exp + p_lo
         c_hi = self.c >> p_lo
 
         exp_lo = self.exp
-        c_lo = self.c & mask_lo
+        c_lo = self.c & _bitmask(p_lo)
 
-        hi = Num(self.s, exp_hi, c_hi)
-        lo = Num(self.s, exp_lo, c_lo)
+        # `c_hi` keeps exactly the top `self.p - p_lo` digits
+        hi = Num._new(self.s, exp_hi, c_hi, self._p - p_lo)
+        lo = Num._new(self.s, exp_lo, c_lo, c_lo.bit_length())
         return (hi, lo)
 
+
+# slot setters used to initialize the otherwise immutable `Num`
+_set_s = Num.s.__set__
+_set_c = Num.c.__set__
+_set_exp = Num.exp.__set__
+_set_p = Num._p.__set__
+_set_e = Num._e.__set__